@@ -84,6 +84,12 @@ def main():
         print(f"❌ Failed to fetch meetings: {e}")
         sys.exit(1)
     
+    # Hydrate several documents in one round trip instead of one per id
+    if meetings:
+        ids = [m["id"] for m in meetings[:5]]
+        docs = source.get_documents_bulk(ids)
+        print(f"\n✓ Bulk-fetched {len(docs)} documents in a single request")
+
     # Test manual refresh
     print("\n🔄 Testing manual refresh...")
     try:
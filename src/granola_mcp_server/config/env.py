@@ -24,6 +24,7 @@ print(cfg.cache_path)
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -69,6 +70,15 @@ class AppConfig(BaseSettings):
         description="Forces stdlib-only mode; disables SQLite usage when True",
     )
 
+    raw_json_responses: bool = Field(
+        default=False,
+        description=(
+            "Serialize list/search tool outputs to JSON once via "
+            "pydantic-core instead of returning models for the runtime "
+            "to re-encode"
+        ),
+    )
+
     # ---- document source configuration ----
     document_source: str = Field(
         default="remote",
@@ -141,11 +151,16 @@ class AppConfig(BaseSettings):
         return self.use_sqlite and not self.stdlib_only
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """Load and validate application configuration from environment variables.
 
     • All variables are prefixed with GRANOLA_ (e.g., GRANOLA_CACHE_PATH).
     • Missing values fall back to the documented defaults.
     • Paths expand ~ and ${VARS}.
+
+    The result is cached: the model is frozen and the environment is not
+    expected to change mid-process. Tests that mutate GRANOLA_* variables
+    should call ``load_config.cache_clear()`` first.
     """
     return AppConfig()
@@ -56,6 +56,31 @@ class DocumentSource(ABC):
         """
         pass
 
+    def get_documents_bulk(
+        self, ids: List[str], *, force: bool = False
+    ) -> Dict[str, Dict[str, object]]:
+        """Fetch several documents in one round trip.
+
+        Implementations should amortize transport cost (one API request
+        or one cache read) rather than fetching per id. This default
+        falls back to per-id lookups for sources that have no cheaper
+        path.
+
+        Args:
+            ids: Document identifiers to fetch.
+            force: Force refresh, bypassing cache.
+
+        Returns:
+            Mapping of id -> document for the ids that were found.
+        """
+        found: Dict[str, Dict[str, object]] = {}
+        for doc_id in ids:
+            doc = self.get_document_by_id(doc_id, force=force)
+            if doc is not None:
+                found[doc_id] = doc
+            force = False  # At most one forced refresh per batch
+        return found
+
     @abstractmethod
     def refresh_cache(self) -> None:
         """Manually refresh the cache.
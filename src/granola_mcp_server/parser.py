@@ -15,9 +15,16 @@ Usage example:
 
 from __future__ import annotations
 
-import json
+import functools
+import heapq
+import mmap
 import os
+import pickle
+import re
+import sys
 from dataclasses import dataclass
+from itertools import groupby
+from operator import methodcaller
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict
@@ -25,23 +32,263 @@ from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict
 from .errors import GranolaParseError
 from .utils import ensure_iso8601
 
+# Decoder bound once at import time; both backends accept str and bytes.
+from .utils.json_backend import json_loads as _json_loads
+
+_WHITESPACE = (b" ", b"\t", b"\r", b"\n")
+
+
+def _extract_cache_string(buf: Any) -> Optional[str]:
+    """Pull the decoded value of the top-level ``"cache"`` member from *buf*.
+
+    The outer file is an object whose dominant member is the ``cache``
+    string (the double-encoded payload). *buf* is a bytes-like buffer
+    (bytes or an mmap view); the string extent is located with C-level
+    ``find`` calls and only that slice is handed to the JSON decoder, so
+    neither the outer object nor a full-file ``str`` is ever allocated.
+    Returns None when the member cannot be located unambiguously or is
+    not a string; callers fall back to a full parse.
+    """
+    length = len(buf)
+    search = 0
+    while True:
+        idx = buf.find(b'"cache"', search)
+        if idx == -1:
+            return None
+        end = idx + 7  # len(b'"cache"')
+        while end < length and buf[end : end + 1] in _WHITESPACE:
+            end += 1
+        if end >= length or buf[end : end + 1] != b":":
+            # Matched a string value, not the key; keep scanning.
+            search = idx + 1
+            continue
+        end += 1
+        while end < length and buf[end : end + 1] in _WHITESPACE:
+            end += 1
+        if end >= length or buf[end : end + 1] != b'"':
+            return None  # cache field is not a string (e.g. dict form)
+
+        # Find the unescaped closing quote of the string.
+        start = end
+        pos = start + 1
+        while True:
+            close = buf.find(b'"', pos)
+            if close == -1:
+                return None
+            backslashes = 0
+            k = close - 1
+            while k > start and buf[k : k + 1] == b"\\":
+                backslashes += 1
+                k -= 1
+            if backslashes % 2 == 0:
+                break
+            pos = close + 1
+
+        try:
+            value = _json_loads(bytes(buf[start : close + 1]))
+        except Exception:
+            return None
+        return value if isinstance(value, str) else None
+
+
 Platform = Literal["meet", "zoom", "teams", "other"]
 
+# Bump when the shape of MeetingDict changes so stale persisted indexes
+# are discarded rather than served.
+_INDEX_SCHEMA_VERSION = 4
+
+# Shared key extractor for transcript grouping; built once so each
+# build_transcript_turns call skips the constructor, and .get-based so
+# a segment without a source degrades instead of raising.
+_SEGMENT_SOURCE = methodcaller("get", "source")
+
+# Name extractor for people/attendees entries; methodcaller rather than
+# itemgetter because entries without a name must yield None, not raise.
+_PERSON_NAME = methodcaller("get", "name")
+
+
+def _names_of(entries: Any) -> Tuple[str, ...]:
+    """De-duplicated, interned names from a people/attendees array.
+
+    The map/filter/dict.fromkeys pipeline runs in C for well-formed
+    arrays; an odd shape anywhere falls back to a per-entry loop that
+    keeps every well-formed entry, so one junk element costs its own
+    name, not the whole list (and a null or non-iterable value yields
+    no names rather than discarding the meeting).
+    """
+    try:
+        return tuple(
+            dict.fromkeys(
+                map(sys.intern, filter(None, map(_PERSON_NAME, entries or ())))
+            )
+        )
+    except (AttributeError, TypeError):
+        pass
+    try:
+        iterator = iter(entries or ())
+    except TypeError:
+        return ()
+    return tuple(
+        dict.fromkeys(
+            sys.intern(name)
+            for p in iterator
+            if isinstance(p, dict) and isinstance(name := p.get("name"), str) and name
+        )
+    )
+
+
+def _intern_str(value: Any) -> Any:
+    """Intern *value* when it is a str; pass anything else through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Conference provider -> normalized platform; unknown providers map to
+# "other" via the lookup fallback.
+_PROVIDER_MAP: Dict[str, Platform] = {
+    "google_meet": "meet",
+    "zoom": "zoom",
+    "teams": "teams",
+    "microsoft_teams": "teams",
+}
+
 
 class MeetingDict(TypedDict, total=False):
-    """TypedDict for normalized meeting records."""
+    """TypedDict schema for serialized meeting records."""
 
     id: str
     title: str
     start_ts: str
     end_ts: Optional[str]
-    participants: List[str]
+    participants: Tuple[str, ...]
     platform: Optional[Platform]
     notes: Optional[str]
     overview: Optional[str]
     summary: Optional[str]
     folder_id: Optional[str]
     folder_name: Optional[str]
+    has_transcript: bool
+
+
+class TranscriptTurn(TypedDict, total=False):
+    """TypedDict schema for one coalesced transcript turn."""
+
+    speaker: str
+    text: str
+    ts: Optional[str]
+
+
+class MeetingRecord:
+    """Normalized meeting record backed by ``__slots__``.
+
+    Slotted instances are roughly half the size of the equivalent dict,
+    which matters when thousands of records sit in the meetings memo.
+    Subscript and ``get`` access are kept so existing callers (and the
+    MCP tools) can treat records like the dicts they replaced;
+    `MeetingDict` remains the schema at the serialization boundary.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "start_ts",
+        "end_ts",
+        "participants",
+        "platform",
+        "notes",
+        "overview",
+        "summary",
+        "folder_id",
+        "folder_name",
+        "has_transcript",
+        "_raw_doc_keys",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        start_ts: str,
+        end_ts: Optional[str] = None,
+        participants: Optional[Tuple[str, ...]] = None,
+        platform: Optional[Platform] = None,
+        notes: Optional[str] = None,
+        overview: Optional[str] = None,
+        summary: Optional[str] = None,
+        folder_id: Optional[str] = None,
+        folder_name: Optional[str] = None,
+        has_transcript: bool = False,
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.start_ts = start_ts
+        self.end_ts = end_ts
+        # Tuples, not lists: nothing mutates participants after the
+        # build, and the tuple is smaller and hashable for downstream
+        # memoization. Serialization converts back at the model boundary.
+        self.participants = participants if participants is not None else ()
+        self.platform = platform
+        self.notes = notes
+        self.overview = overview
+        self.summary = summary
+        self.folder_id = folder_id
+        self.folder_name = folder_name
+        self.has_transcript = has_transcript
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError as exc:
+            raise KeyError(key) from exc
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access; unknown keys return *default*."""
+        return getattr(self, key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self.__slots__ and hasattr(self, key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MeetingRecord):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:  # pragma: no cover - debug aid
+        return f"MeetingRecord(id={self.id!r}, title={self.title!r})"
+
+    def to_dict(self) -> MeetingDict:
+        """Serialize to the `MeetingDict` schema."""
+        out: Dict[str, Any] = {
+            key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)
+        }
+        return out  # type: ignore[return-value]
+
+
+# Timestamps already carrying an explicit offset are returned verbatim.
+# 'Z'-suffixed strings are deliberately excluded: they must still be
+# rewritten to '+00:00' so normalized strings compare lexicographically.
+_ISO_CANONICAL_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?[+-]\d{2}:\d{2}$"
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_ts_str(value: str) -> str:
+    """Normalize a timestamp string to ISO 8601, memoized per process.
+
+    Pure conversion, so cached results never go stale; Granola caches
+    repeat the same timestamp strings across documents and reloads.
+    """
+    if _ISO_CANONICAL_RE.match(value):
+        return value
+    try:
+        return ensure_iso8601(value)
+    except Exception:
+        return value  # Return as-is if parsing fails
 
 
 def _normalize_ts(value: Any) -> Optional[str]:
@@ -58,10 +305,7 @@ def _normalize_ts(value: Any) -> Optional[str]:
         dt = datetime.fromtimestamp(value, tz=timezone.utc)
         return dt.isoformat()
     if isinstance(value, str):
-        try:
-            return ensure_iso8601(value)
-        except Exception:
-            return value  # Return as-is if parsing fails
+        return _normalize_ts_str(value)
     return str(value)
 
 
@@ -76,6 +320,116 @@ class CacheState:
         return self.loaded_at.isoformat()
 
 
+def _parse_cache_file(path: Path) -> Dict[str, Any]:
+    """Parse the double-encoded cache at *path* into the inner object.
+
+    Raises:
+        GranolaParseError: If the file is unreadable or malformed.
+    """
+    try:
+        f = path.open("rb")
+    except OSError as exc:
+        raise GranolaParseError(
+            f"Cache file not readable: {path}", {"path": str(path)}
+        ) from exc
+
+    # Fast path: mmap the file and decode only the 'cache' string,
+    # skipping the outer object and any sibling subtrees. The kernel
+    # pages the file in on demand; no full-file copy is made unless
+    # the fallback full parse is needed.
+    cache_str: Optional[str] = None
+    data: Optional[bytes] = None
+    with f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cache_str = _extract_cache_string(mm)
+                if cache_str is None:
+                    data = bytes(mm)
+        except ValueError:  # empty files cannot be mapped
+            data = f.read()
+
+    inner: Any = None
+    if cache_str is not None:
+        del data  # release the raw buffer before parsing the inner JSON
+        try:
+            inner = _json_loads(cache_str)
+        except Exception:
+            inner = None
+        # Drop the unescaped payload string now rather than at
+        # function exit; it is as large as the whole cache and would
+        # otherwise coexist with the parsed tree through the
+        # validation below.
+        del cache_str
+        if not isinstance(inner, dict):
+            # The byte scan is not depth-aware, so it can land on a
+            # nested "cache" member instead of the top-level one. A
+            # failed or non-dict inner decode therefore means the
+            # extraction was wrong, not that the file is bad: fall
+            # through to the full outer parse.
+            inner = None
+            try:
+                data = path.read_bytes()
+            except OSError as exc:
+                raise GranolaParseError(
+                    f"Cache file not readable: {path}", {"path": str(path)}
+                ) from exc
+
+    if inner is None:
+        try:
+            outer = _json_loads(data)
+        except Exception as exc:
+            raise GranolaParseError(
+                "Failed to read outer JSON",
+                {"path": str(path), "reason": str(exc)},
+            ) from exc
+
+        try:
+            cache_field = outer["cache"]
+            if isinstance(cache_field, str):
+                inner = _json_loads(cache_field)
+            elif isinstance(cache_field, dict):
+                inner = cache_field
+            else:
+                raise GranolaParseError(
+                    f"Cache field is neither string nor dict: {type(cache_field)}",
+                    {"path": str(path), "outer_keys": list(outer.keys())},
+                )
+        except KeyError as exc:
+            raise GranolaParseError(
+                "Missing 'cache' field in outer JSON",
+                {"path": str(path), "outer_keys": list(outer.keys())},
+            ) from exc
+        except Exception as exc:
+            raise GranolaParseError(
+                "Failed to decode cache field",
+                {"path": str(path), "reason": str(exc)},
+            ) from exc
+
+    if not isinstance(inner, dict):
+        raise GranolaParseError(
+            "Inner cache is not a dict",
+            {"path": str(path), "inner_type": type(inner).__name__},
+        )
+    if "state" not in inner:
+        raise GranolaParseError(
+            "Inner JSON missing 'state' field",
+            {"path": str(path), "inner_keys": list(inner.keys())},
+        )
+    return inner
+
+
+@functools.lru_cache(maxsize=4)
+def _load_inner_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a cache file once per on-disk version, shared process-wide.
+
+    Keyed on stat identity so every parser instance pointed at an
+    unchanged file reuses one parsed tree; Granola rewriting the cache
+    changes mtime and naturally misses. Errors are not cached, so a
+    transient failure retries on the next call.
+    """
+    return _parse_cache_file(Path(path_str))
+
+
 class GranolaParser:
     """Parser for the Granola double-encoded JSON cache file.
 
@@ -86,11 +440,28 @@ class GranolaParser:
     Args:
         cache_path: Path to the cache file. If None, must be provided in
             `load_cache`.
+        index_path: Optional path for a persisted index of normalized
+            meetings. When set, `get_meetings` stores its output there
+            (keyed by the cache file's mtime+size) and warm starts load
+            it back instead of re-parsing the cache. Off by default to
+            keep the parser side-effect free.
     """
 
-    def __init__(self, cache_path: Optional[str | Path] = None) -> None:
+    def __init__(
+        self,
+        cache_path: Optional[str | Path] = None,
+        index_path: Optional[str | Path] = None,
+    ) -> None:
         self._cache_path: Optional[Path] = Path(cache_path) if cache_path else None
+        self._index_path: Optional[Path] = Path(index_path) if index_path else None
         self._cache: Optional[CacheState] = None
+        # Stat key of the file version backing self._cache; a differing
+        # on-disk key means the memoized state is stale.
+        self._state_stat: Optional[Tuple[int, int]] = None
+        # Normalized-meeting memo, invalidated when the file on disk changes.
+        self._meetings_cache: Optional[List[MeetingRecord]] = None
+        self._meetings_index: Dict[str, MeetingRecord] = {}
+        self._cache_stat: Optional[Tuple[int, int]] = None
 
     @classmethod
     def from_path(cls, path: str | Path) -> GranolaParser:
@@ -102,6 +473,11 @@ class GranolaParser:
     def load_cache(self, force_reload: bool = False) -> Dict[str, Any]:
         """Load and parse the cache file with double-JSON decoding.
 
+        Parsed trees are shared across parser instances for the same
+        file: the module-level memo is keyed on (path, mtime_ns, size),
+        so a parser constructed per request pays one stat, not a full
+        reparse, until Granola rewrites the cache.
+
         Args:
             force_reload: If true, bypass memoization and reload from disk.
 
@@ -112,59 +488,43 @@ class GranolaParser:
             GranolaParseError: If the file is unreadable or malformed.
         """
 
-        if self._cache is not None and not force_reload:
-            return self._cache.state
+        if force_reload:
+            self._meetings_cache = None
+            self._meetings_index = {}
+            self._cache_stat = None
+            _load_inner_cached.cache_clear()
 
         if self._cache_path is None:
             raise GranolaParseError("Cache path not provided")
 
         path = self._cache_path
-        if not path.exists() or not os.access(path, os.R_OK):
-            raise GranolaParseError(
-                f"Cache file not readable: {path}", {"path": str(path)}
-            )
-
         try:
-            with path.open("r", encoding="utf-8") as f:
-                outer = json.load(f)
-        except Exception as exc:  # pragma: no cover - filesystem errors
+            st = os.stat(path)
+        except OSError as exc:
+            # Keep serving the memoized state if the file vanished from
+            # under a live parser; only a cold load has nothing to offer.
+            if self._cache is not None and not force_reload:
+                return self._cache.state
             raise GranolaParseError(
-                "Failed to read outer JSON", {"path": str(path), "reason": str(exc)}
+                f"Cache file not readable: {path}", {"path": str(path)}
             ) from exc
 
-        try:
-            cache_field = outer["cache"]
-            if isinstance(cache_field, str):
-                inner = json.loads(cache_field)
-            elif isinstance(cache_field, dict):
-                inner = cache_field
-            else:
-                raise GranolaParseError(
-                    f"Cache field is neither string nor dict: {type(cache_field)}",
-                    {"path": str(path), "outer_keys": list(outer.keys())},
-                )
-        except KeyError as exc:
-            raise GranolaParseError(
-                "Missing 'cache' field in outer JSON",
-                {"path": str(path), "outer_keys": list(outer.keys())},
-            ) from exc
-        except Exception as exc:
-            raise GranolaParseError(
-                "Failed to decode cache field", {"path": str(path), "reason": str(exc)}
-            ) from exc
+        # One stat per call keeps the memo honest: a rewritten file
+        # (new mtime/size) must never be answered with the old tree,
+        # or downstream memos and the persisted index get stamped with
+        # a stat key from a version they were not built from.
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if (
+            self._cache is not None
+            and not force_reload
+            and stat_key == self._state_stat
+        ):
+            return self._cache.state
 
-        if not isinstance(inner, dict):
-            raise GranolaParseError(
-                "Inner cache is not a dict",
-                {"path": str(path), "inner_type": type(inner).__name__},
-            )
-        if "state" not in inner:
-            raise GranolaParseError(
-                "Inner JSON missing 'state' field",
-                {"path": str(path), "inner_keys": list(inner.keys())},
-            )
+        inner = _load_inner_cached(str(path), st.st_mtime_ns, st.st_size)
 
         self._cache = CacheState(state=inner, loaded_at=datetime.now(timezone.utc))
+        self._state_stat = stat_key
         return inner
 
     def reload(self) -> Dict[str, Any]:
@@ -193,8 +553,19 @@ class GranolaParser:
         if self._cache_path is None:
             raise GranolaParseError("Cache path not provided")
         path = self._cache_path
-        exists = path.exists()
-        size = path.stat().st_size if exists else 0
+        # One stat covers existence and size; readability stays with
+        # os.access, which answers "can this process read it" — mode
+        # bits alone cannot (a 0o400 file owned by someone else has a
+        # read bit set but is not readable here).
+        try:
+            st = os.stat(path)
+            exists = True
+            size = st.st_size
+            readable = os.access(path, os.R_OK)
+        except OSError:
+            exists = False
+            size = 0
+            readable = False
         valid = False
         meeting_count = 0
         last_loaded = None
@@ -213,158 +584,330 @@ class GranolaParser:
         return {
             "path": str(path),
             "exists": exists,
-            "readable": os.access(path, os.R_OK),
+            "readable": readable,
             "size_bytes": size,
             "meeting_count": meeting_count,
             "valid_structure": valid,
             "last_loaded_ts": last_loaded,
         }
 
+    def _load_state_slice(self, *keys: str) -> Tuple[Any, ...]:
+        """Return the requested top-level `state` subtrees.
+
+        The full parse is memoized in `load_cache`, so slicing is a set
+        of dict lookups. Callers that need only a few subtrees (e.g. a
+        metadata-only query path) get exactly those instead of holding a
+        reference to the whole state dict. Missing or malformed subtrees
+        yield empty dicts.
+        """
+        inner = self.load_cache()
+        state = inner.get("state", {})
+        if not isinstance(state, dict):
+            return tuple({} for _ in keys)
+        return tuple(state.get(key, {}) for key in keys)
+
+    # ---------------------- Persisted index ----------------------
+
+    def _load_persisted_index(
+        self, stat_key: Tuple[int, int]
+    ) -> Optional[List[MeetingRecord]]:
+        """Load the persisted index if it matches the cache file's key."""
+
+        try:
+            with self._index_path.open("rb") as f:  # type: ignore[union-attr]
+                payload = pickle.load(f)
+            if payload.get("key") == (*stat_key, _INDEX_SCHEMA_VERSION):
+                items = payload.get("items")
+                if isinstance(items, list):
+                    return items
+        except Exception:
+            pass
+        return None
+
+    def _store_persisted_index(
+        self, stat_key: Tuple[int, int], items: List[MeetingRecord]
+    ) -> None:
+        """Atomically write the persisted index; failures are non-fatal."""
+
+        index_path = self._index_path
+        assert index_path is not None
+        tmp = index_path.with_suffix(index_path.suffix + ".tmp")
+        try:
+            with tmp.open("wb") as f:
+                pickle.dump(
+                    {"key": (*stat_key, _INDEX_SCHEMA_VERSION), "items": items},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp, index_path)
+        except Exception:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
     # ---------------------- Meeting extraction ----------------------
 
-    def get_meetings(self, debug: bool = False) -> List[MeetingDict]:
+    def get_meetings(
+        self, debug: bool = False, limit: Optional[int] = None
+    ) -> List[MeetingRecord]:
         """Extract normalized meetings from the cache.
 
         This combines `documents`, `meetingsMetadata`, `documentPanels`,
-        and folder lists.
+        and folder lists. Transcript segments are never materialized
+        here — listing only checks each id against the raw transcripts
+        map to set `has_transcript`, so the cost of this pass is
+        independent of transcript size; segments are decoded lazily in
+        `build_transcript_turns`.
 
         Args:
             debug: If true, include select raw fields for troubleshooting.
+            limit: If set, return only the `limit` most recent meetings;
+                a cold pass then selects top-K via a heap instead of
+                sorting the full list.
 
         Returns:
             List of meeting dictionaries suitable for conversion to
             `MeetingSummary`/`Meeting` Pydantic models.
         """
 
-        inner = self.load_cache()
-        state = inner.get("state", {})
-        if not isinstance(state, dict):
-            return []
-
-        documents = state.get("documents", {})
-        metadata_map = state.get("meetingsMetadata", {})
-        panels_map = state.get("documentPanels", {})
-        lists_map = state.get("documentLists", {})
-        lists_meta = state.get("documentListsMetadata", {})
+        stat_key: Optional[Tuple[int, int]] = None
+        if self._cache_path is not None:
+            try:
+                stat = self._cache_path.stat()
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stat_key = None
+        if (
+            not debug
+            and self._meetings_cache is not None
+            and stat_key is not None
+            and stat_key == self._cache_stat
+        ):
+            cached = self._meetings_cache
+            return cached if limit is None else cached[:limit]
+
+        if not debug and stat_key is not None and self._index_path is not None:
+            persisted = self._load_persisted_index(stat_key)
+            if persisted is not None:
+                self._meetings_cache = persisted
+                self._meetings_index = {item["id"]: item for item in persisted}
+                self._cache_stat = stat_key
+                return persisted if limit is None else persisted[:limit]
+
+        (
+            documents,
+            metadata_map,
+            lists_map,
+            lists_meta,
+            transcripts_map,
+        ) = self._load_state_slice(
+            "documents",
+            "meetingsMetadata",
+            "documentLists",
+            "documentListsMetadata",
+            "transcripts",
+        )
+        if not isinstance(transcripts_map, dict):
+            transcripts_map = {}
 
         # Build reverse folder mapping: meeting_id -> (folder_id, folder_name)
-        folder_map: Dict[str, Tuple[str, str]] = {}
+        folder_map: Dict[str, Tuple[str, Optional[str]]] = {}
         if isinstance(lists_map, dict) and isinstance(lists_meta, dict):
-            for folder_id, ids in lists_map.items():
-                if not isinstance(ids, list):
-                    continue
-                folder_meta = lists_meta.get(folder_id, {})
-                folder_name = (
-                    folder_meta.get("title") if isinstance(folder_meta, dict) else None
+            folder_titles = {
+                folder_id: _intern_str(
+                    meta.get("title") if isinstance(meta, dict) else None
                 )
-                for meeting_id in ids:
-                    folder_map[meeting_id] = (folder_id, folder_name)
+                for folder_id, meta in lists_meta.items()
+            }
+            folder_map = {
+                meeting_id: (folder_id, folder_titles.get(folder_id))
+                for folder_id, ids in lists_map.items()
+                if isinstance(ids, list)
+                for meeting_id in ids
+            }
 
-        items: List[MeetingDict] = []
+        items: List[MeetingRecord] = []
         if not isinstance(documents, dict):
             return items
+        if not isinstance(metadata_map, dict):
+            metadata_map = {}
+
+        # Normalize each distinct raw timestamp once per pass; caches
+        # repeat the same created_at values heavily (templates, folders).
+        ts_memo: Dict[Any, Optional[str]] = {}
+
+        # Hot-loop rebinds: skip the attribute lookup per document.
+        folder_for = folder_map.get
+        meta_for = metadata_map.get
+        transcript_for = transcripts_map.get
 
         for doc_key, doc in documents.items():
-            if not isinstance(doc, dict):
-                continue
-            if doc.get("type") and doc["type"] != "meeting":
-                # Only surface meetings
-                continue
+            # Well-formed caches hold dicts at every level below, so the
+            # per-field isinstance guards are dropped from the hot loop;
+            # any shape violation surfaces as an exception and drops just
+            # that document.
+            try:
+                if doc.get("type") and doc["type"] != "meeting":
+                    # Only surface meetings
+                    continue
 
-            meeting_id = str(doc.get("id") or doc_key)
-            title = doc.get("title") or "Untitled Meeting"
-            created = doc.get("created_at")
-            start_ts = _normalize_ts(created)
-
-            # Participants: prefer documents[*].people[].name, de-dupe and preserve order
-            participants: List[str] = []
-            people = doc.get("people", [])
-            if isinstance(people, list):
-                seen = set()
-                for person in people:
-                    if isinstance(person, dict):
-                        name = person.get("name")
-                        if name and name not in seen:
-                            participants.append(name)
-                            seen.add(name)
-
-            # Fallback to metadata attendees if no people found
-            if not participants and isinstance(metadata_map, dict):
-                meta = metadata_map.get(meeting_id, {})
-                if isinstance(meta, dict):
-                    attendees = meta.get("attendees", [])
-                    if isinstance(attendees, list):
-                        seen = set(participants)
-                        for attendee in attendees:
-                            if isinstance(attendee, dict):
-                                name = attendee.get("name")
-                                if name and name not in seen:
-                                    participants.append(name)
-                                    seen.add(name)
-
-            # Platform detection
-            platform: Optional[Platform] = None
-            if isinstance(metadata_map, dict):
-                meta = metadata_map.get(meeting_id, {})
-                if isinstance(meta, dict):
-                    conf = meta.get("conference")
-                    if isinstance(conf, dict):
-                        provider = conf.get("provider")
-                        if provider == "google_meet":
-                            platform = "meet"
-                        elif provider in {"zoom", "teams"}:
-                            platform = provider  # type: ignore[assignment]
-                        elif provider:
-                            platform = "other"
-
-            notes = doc.get("notes_plain") or doc.get("notes_markdown")
-            overview = doc.get("overview")
-            summary = doc.get("summary")
-
-            # Panels: capture first non-trivial original_content
-            if not notes and isinstance(panels_map, dict):
-                meeting_panels = panels_map.get(meeting_id, {})
-                if isinstance(meeting_panels, dict):
-                    for panel in meeting_panels.values():
-                        if isinstance(panel, dict):
-                            original = panel.get("original_content")
-                            if original and isinstance(original, str):
-                                original = original.strip()
-                                if original and original != "<hr>":
-                                    notes = original
-                                    break
-
-            folder_info = folder_map.get(meeting_id)
-            folder_id = folder_info[0] if folder_info else None
-            folder_name = folder_info[1] if folder_info else None
-
-            item: MeetingDict = {
-                "id": meeting_id,
-                "title": title,
-                "start_ts": start_ts or "",
-                "end_ts": None,
-                "participants": participants,
-                "platform": platform,
-                "notes": notes,
-                "overview": overview,
-                "summary": summary,
-                "folder_id": folder_id,
-                "folder_name": folder_name,
-            }
+                meeting_id = str(doc.get("id") or doc_key)
+                title = doc.get("title") or "Untitled Meeting"
+
+                # Single metadata lookup per meeting, shared by the
+                # attendees fallback and platform detection below.
+                meta = meta_for(meeting_id)
+                if not isinstance(meta, dict):
+                    meta = None
+                created = doc.get("created_at")
+                try:
+                    start_ts = ts_memo[created]
+                except KeyError:
+                    start_ts = ts_memo[created] = _normalize_ts(created)
+                except TypeError:  # unhashable raw value
+                    start_ts = _normalize_ts(created)
+
+                # Participants: prefer documents[*].people[].name, de-dupe
+                # and preserve order; dict.fromkeys does both in C.
+                participants = _names_of(doc.get("people"))
+
+                # Fallback to metadata attendees if no people found
+                if not participants and meta:
+                    participants = _names_of(meta.get("attendees"))
+
+                # Platform detection
+                platform: Optional[Platform] = None
+                conf = meta.get("conference") if meta else None
+                if isinstance(conf, dict):
+                    provider = conf.get("provider")
+                    platform = _PROVIDER_MAP.get(provider) or (
+                        "other" if provider else None
+                    )
+
+                # Inline notes only; the panel fallback is deferred to
+                # get_notes so listing stays O(meetings), not O(panels).
+                notes = doc.get("notes_plain") or doc.get("notes_markdown")
+                overview = doc.get("overview")
+                summary = doc.get("summary")
+
+                folder_info = folder_for(meeting_id)
+                folder_id = folder_info[0] if folder_info else None
+                folder_name = folder_info[1] if folder_info else None
+
+                # Positional construction: skips the keyword-argument
+                # matching CPython does per call, which adds up over
+                # thousands of records. Order mirrors __slots__.
+                item = MeetingRecord(
+                    meeting_id,
+                    title,
+                    start_ts or "",
+                    None,
+                    participants,
+                    platform,
+                    notes,
+                    overview,
+                    summary,
+                    folder_id,
+                    folder_name,
+                    bool(transcript_for(meeting_id)),
+                )
+            except (AttributeError, TypeError, KeyError):
+                # Malformed document (non-dict where a dict is expected);
+                # skip it rather than fail the whole parse.
+                continue
 
             if debug:
-                item["_raw_doc_keys"] = list(doc.keys())  # type: ignore[typeddict-item]
+                item._raw_doc_keys = list(doc.keys())
 
             items.append(item)
 
+        # Top-K requested on a cold pass: O(N log K) heap selection
+        # instead of a full sort. The memo is left unpopulated since the
+        # full ordering was never built.
+        if limit is not None and limit < len(items):
+            return heapq.nlargest(limit, items, key=lambda x: x.get("start_ts") or "")
+
         # Sort by start_ts descending if available
         items.sort(key=lambda x: x.get("start_ts") or "", reverse=True)
+
+        if not debug:
+            self._meetings_cache = items
+            self._meetings_index = {item["id"]: item for item in items}
+            self._cache_stat = stat_key
+            if stat_key is not None and self._index_path is not None:
+                self._store_persisted_index(stat_key, items)
         return items
 
-    def get_meeting_by_id(self, meeting_id: str) -> Optional[MeetingDict]:
+    def get_meeting_by_id(self, meeting_id: str) -> Optional[MeetingRecord]:
         """Return a single meeting dictionary by id, or None if not found."""
 
-        for item in self.get_meetings():
-            if item.get("id") == meeting_id:
-                return item
+        self.get_meetings()  # Ensure the id index is populated and fresh
+        return self._meetings_index.get(meeting_id)
+
+    def build_transcript_turns(self, meeting_id: str) -> List[TranscriptTurn]:
+        """Coalesce a meeting's transcript segments into speaker turns.
+
+        Adjacent segments from the same source merge into one turn
+        carrying the first segment's timestamp. The grouping runs in C
+        (groupby + methodcaller + join); segments are only walked when a
+        transcript is actually requested. Timestamps pass through as
+        the raw ISO strings — nothing here needs datetime semantics,
+        so per-segment parsing is deliberately avoided; callers that do
+        can use utils.parse_iso8601, which memoizes.
+        """
+
+        (transcripts_map,) = self._load_state_slice("transcripts")
+        segments = (
+            transcripts_map.get(meeting_id)
+            if isinstance(transcripts_map, dict)
+            else None
+        )
+        if not isinstance(segments, list):
+            return []
+
+        # Malformed shapes degrade per segment, mirroring the meeting
+        # build pass: non-dict entries are skipped, a missing source
+        # becomes an empty speaker.
+        segments = [s for s in segments if isinstance(s, dict)]
+
+        turns: List[TranscriptTurn] = []
+        for speaker, group in groupby(segments, key=_SEGMENT_SOURCE):
+            seg_list = list(group)
+            turns.append(
+                {
+                    "speaker": (
+                        _intern_str(speaker) if isinstance(speaker, str) else ""
+                    ),
+                    "text": " ".join(s.get("text") or "" for s in seg_list),
+                    "ts": seg_list[0].get("ts"),
+                }
+            )
+        return turns
+
+    def get_notes(self, meeting_id: str) -> Optional[str]:
+        """Return notes for one meeting, scanning its panels on demand.
+
+        `get_meetings` only carries inline notes; this walks the
+        documentPanels of the requested meeting — and no others — for
+        the first non-trivial original_content.
+        """
+
+        item = self.get_meeting_by_id(meeting_id)
+        if item is not None and item.notes:
+            return item.notes
+
+        (panels_map,) = self._load_state_slice("documentPanels")
+        if not isinstance(panels_map, dict):
+            return None
+        meeting_panels = panels_map.get(meeting_id)
+        if not isinstance(meeting_panels, dict):
+            return None
+        for panel in meeting_panels.values():
+            if isinstance(panel, dict):
+                original = panel.get("original_content")
+                if original and isinstance(original, str):
+                    original = original.strip()
+                    if original and original != "<hr>":
+                        return original
         return None
@@ -9,12 +9,16 @@ from __future__ import annotations
 
 from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MeetingSummary(BaseModel):
     """Summary view of a meeting.
 
+    Output-only: instances are built once per item on the list/search
+    hot path and never mutated, so the model is frozen. (BaseModel
+    cannot be slotted; frozen at least keeps instances shareable.)
+
     Attributes:
         id: Stable meeting identifier.
         title: Meeting title.
@@ -25,6 +29,8 @@ class MeetingSummary(BaseModel):
         metadata: Bag for unknown/extra fields.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     start_ts: str
@@ -69,13 +75,22 @@ class ListMeetingsOutput(BaseModel):
     next_cursor: Optional[str] = None
 
 
+class TranscriptTurn(BaseModel):
+    """One coalesced transcript turn (adjacent same-speaker segments merged)."""
+
+    speaker: str
+    text: str
+    ts: Optional[str] = None
+
+
 class GetMeetingInput(BaseModel):
     id: str
-    include: Optional[List[Literal["notes", "metadata"]]] = None
+    include: Optional[List[Literal["notes", "metadata", "transcript"]]] = None
 
 
 class GetMeetingOutput(BaseModel):
     meeting: Meeting
+    transcript: Optional[List[TranscriptTurn]] = None
 
 
 class SearchFilters(BaseModel):
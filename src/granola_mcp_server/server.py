@@ -22,13 +22,10 @@ from .schemas import (
     GetMeetingInput,
     GetMeetingOutput,
     ListMeetingsInput,
-    ListMeetingsOutput,
     RefreshCacheInput,
     RefreshCacheOutput,
     SearchMeetingsInput,
-    SearchMeetingsOutput,
     StatsInput,
-    StatsOutput,
 )
 from .sources import create_document_source
 from .sources.adapter import DocumentSourceAdapter
@@ -46,13 +43,27 @@ from .tools import (
 def _register_fastmcp_tools(app, config, adapter):
     # Namespace: granola.*
 
+    raw_json = getattr(config, "raw_json_responses", False)
+
+    def _finish(model):
+        """Optionally serialize a large output once, in pydantic-core.
+
+        When GRANOLA_RAW_JSON_RESPONSES is set, list/search payloads are
+        encoded to a JSON string here (Rust serializer, no revalidation)
+        so the runtime passes them through instead of re-encoding the
+        model field by field.
+        """
+        if raw_json:
+            return model.__pydantic_serializer__.to_json(model).decode("utf-8")
+        return model
+
     @app.tool("granola.conversations.list")
-    def meetings_list_conversations(params: ListMeetingsInput) -> ListMeetingsOutput:
-        return list_meetings(config, adapter, params)
+    def meetings_list_conversations(params: ListMeetingsInput):
+        return _finish(list_meetings(config, adapter, params))
 
     @app.tool("granola.meetings.list")
-    def meetings_list(params: ListMeetingsInput) -> ListMeetingsOutput:
-        return list_meetings(config, adapter, params)
+    def meetings_list(params: ListMeetingsInput):
+        return _finish(list_meetings(config, adapter, params))
 
     @app.tool("granola.conversations.get")
     def meetings_get_conversations(params: GetMeetingInput) -> GetMeetingOutput:
@@ -63,16 +74,16 @@ def _register_fastmcp_tools(app, config, adapter):
         return get_meeting(config, adapter, params)
 
     @app.tool("granola.meetings.search")
-    def meetings_search(params: SearchMeetingsInput) -> SearchMeetingsOutput:
-        return search_meetings(config, adapter, params)
+    def meetings_search(params: SearchMeetingsInput):
+        return _finish(search_meetings(config, adapter, params))
 
     @app.tool("granola.meetings.export_markdown")
     def meetings_export_md(params: ExportMarkdownInput) -> ExportMarkdownOutput:
         return export_markdown(config, adapter, params)
 
     @app.tool("granola.meetings.stats")
-    def meetings_stats_tool(params: StatsInput) -> StatsOutput:
-        return meetings_stats(config, adapter, params)
+    def meetings_stats_tool(params: StatsInput):
+        return _finish(meetings_stats(config, adapter, params))
 
     @app.tool("granola.cache.status")
     def cache_status_tool() -> CacheStatusOutput:
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from ..document_source import DocumentSource
-from ..parser import MeetingDict
+from ..parser import MeetingRecord
 
 
 class DocumentSourceAdapter:
@@ -27,6 +27,11 @@ class DocumentSourceAdapter:
         self._source = source
         self._cache: Optional[Dict[str, Any]] = None
         self._loaded_at: Optional[datetime] = None
+        # Normalized meetings and their id index, memoized per cache
+        # load so repeated tool calls neither rebuild nor rescan.
+        self._meetings_memo: Optional[List[MeetingRecord]] = None
+        self._meetings_by_id: Dict[str, MeetingRecord] = {}
+        self._meetings_src: Optional[Dict[str, Any]] = None
 
     def load_cache(self, force_reload: bool = False) -> Dict[str, Any]:
         """Load documents into a cache structure.
@@ -67,18 +72,21 @@ class DocumentSourceAdapter:
         """Force reload from source."""
         return self.load_cache(force_reload=True)
 
-    def get_meetings(self, debug: bool = False) -> List[MeetingDict]:
+    def get_meetings(self, debug: bool = False) -> List[MeetingRecord]:
         """Get meetings in the format expected by tools.
-        
-        This method converts raw documents into the normalized MeetingDict
-        format that the existing tools expect.
+
+        This method converts raw documents into the same slotted
+        `MeetingRecord` objects the parser emits, so the memoized list
+        costs the same per meeting regardless of source.
         """
         cache = self.load_cache()
+        if self._meetings_memo is not None and self._meetings_src is cache:
+            return self._meetings_memo
         state = cache.get("state", {})
         documents = state.get("documents", {})
-        
-        meetings: List[MeetingDict] = []
-        
+
+        meetings: List[MeetingRecord] = []
+
         if not isinstance(documents, dict):
             return meetings
         
@@ -128,33 +136,53 @@ class DocumentSourceAdapter:
                 # If notes is structured (ProseMirror), try to extract plain text
                 notes = None  # Will need to handle structured notes separately
             
-            meeting: MeetingDict = {
-                "id": meeting_id,
-                "title": title,
-                "start_ts": start_ts,
-                "end_ts": None,
-                "participants": participants,
-                "platform": None,  # Platform detection would need google_calendar_event
-                "notes": notes if isinstance(notes, str) else None,
-                "overview": doc.get("overview") if isinstance(doc.get("overview"), str) else None,
-                "summary": doc.get("summary") if isinstance(doc.get("summary"), str) else None,
-                "folder_id": None,
-                "folder_name": None,
-            }
-            
-            meetings.append(meeting)
+            # Positional construction, mirroring the parser's hot loop.
+            # Platform detection would need google_calendar_event data
+            # the API does not return, so it stays None here.
+            meetings.append(
+                MeetingRecord(
+                    meeting_id,
+                    title,
+                    start_ts,
+                    None,
+                    tuple(participants),
+                    None,
+                    notes if isinstance(notes, str) else None,
+                    doc.get("overview") if isinstance(doc.get("overview"), str) else None,
+                    doc.get("summary") if isinstance(doc.get("summary"), str) else None,
+                )
+            )
         
         # Sort by start_ts descending
         meetings.sort(key=lambda x: x.get("start_ts") or "", reverse=True)
-        
+
+        self._meetings_src = cache
+        self._meetings_memo = meetings
+        self._meetings_by_id = {m["id"]: m for m in meetings}
+
         return meetings
 
-    def get_meeting_by_id(self, meeting_id: str) -> Optional[MeetingDict]:
-        """Get a single meeting by ID."""
-        for meeting in self.get_meetings():
-            if meeting.get("id") == meeting_id:
-                return meeting
-        return None
+    def get_meeting_by_id(self, meeting_id: str) -> Optional[MeetingRecord]:
+        """Get a single meeting by ID via the prebuilt index."""
+        self.get_meetings()
+        return self._meetings_by_id.get(meeting_id)
+
+    def build_transcript_turns(self, meeting_id: str) -> List[Dict[str, Any]]:
+        """Return transcript turns for one meeting.
+
+        Remote documents carry no transcripts subtree, so this is
+        always empty; it exists to keep the parser-like surface intact.
+        """
+        return []
+
+    def get_notes(self, meeting_id: str) -> Optional[str]:
+        """Return notes for one meeting.
+
+        Source documents carry notes inline (there is no panels subtree
+        here), so this is just the normalized meeting's notes field.
+        """
+        meeting = self.get_meeting_by_id(meeting_id)
+        return meeting.get("notes") if meeting else None
 
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache information from the underlying source."""
@@ -25,6 +25,39 @@ class LocalFileDocumentSource(DocumentSource):
 
     def __init__(self, cache_path: str | Path):
         self._parser = GranolaParser(cache_path)
+        # Derived views of state['documents'], rebuilt only when the
+        # parser hands back a new mapping (first load or reload).
+        self._docs_src: Optional[Dict[str, object]] = None
+        self._docs_list: List[Dict[str, object]] = []
+        self._by_id: Dict[str, Dict[str, object]] = {}
+
+    def _documents(self, force: bool = False) -> None:
+        """Refresh the cached list/id views if the underlying load changed."""
+        if force:
+            self._parser.reload()
+
+        cache_data = self._parser.load_cache()
+        state = cache_data.get("state", {})
+        documents = state.get("documents", {})
+
+        if documents is self._docs_src:
+            return
+
+        # Single comprehension pass; documents missing an id get a
+        # shallow copy with it filled in, so the parser's own cache is
+        # never mutated as a side effect.
+        by_id: Dict[str, Dict[str, object]] = (
+            {
+                doc_id: (doc if "id" in doc else {**doc, "id": doc_id})
+                for doc_id, doc in documents.items()
+                if isinstance(doc, dict)
+            }
+            if isinstance(documents, dict)
+            else {}
+        )
+        self._docs_src = documents if isinstance(documents, dict) else None
+        self._docs_list = list(by_id.values())
+        self._by_id = by_id
 
     def get_documents(
         self,
@@ -35,55 +68,45 @@ class LocalFileDocumentSource(DocumentSource):
         force: bool = False,
     ) -> List[Dict[str, object]]:
         """Fetch documents from local cache file.
-        
+
         Note: limit, offset, and include_last_viewed_panel are accepted for
         interface compatibility but don't affect the local file read since
         the entire cache is always loaded.
         """
-        if force:
-            self._parser.reload()
-        
-        cache_data = self._parser.load_cache()
-        state = cache_data.get("state", {})
-        documents = state.get("documents", {})
-        
-        # Convert documents dict to list format
-        docs_list = []
-        if isinstance(documents, dict):
-            for doc_id, doc in documents.items():
-                if isinstance(doc, dict):
-                    # Ensure id field is set
-                    if "id" not in doc:
-                        doc["id"] = doc_id
-                    docs_list.append(doc)
-        
-        # Apply pagination if specified
+        self._documents(force=force)
+        docs_list = self._docs_list
+
+        # Apply pagination if specified; slicing copies, so the cached
+        # list itself is never handed out to callers.
         if offset is not None:
             docs_list = docs_list[offset:]
         if limit is not None:
             docs_list = docs_list[:limit]
-            
+        if docs_list is self._docs_list:
+            docs_list = list(docs_list)
+
         return docs_list
 
     def get_document_by_id(
         self, doc_id: str, *, force: bool = False
     ) -> Optional[Dict[str, object]]:
         """Fetch a single document by ID from local cache."""
-        if force:
-            self._parser.reload()
-            
-        cache_data = self._parser.load_cache()
-        state = cache_data.get("state", {})
-        documents = state.get("documents", {})
-        
-        if isinstance(documents, dict):
-            doc = documents.get(doc_id)
-            if isinstance(doc, dict):
-                if "id" not in doc:
-                    doc["id"] = doc_id
-                return doc
-        
-        return None
+        self._documents(force=force)
+        return self._by_id.get(doc_id)
+
+    def get_documents_bulk(
+        self, ids: List[str], *, force: bool = False
+    ) -> Dict[str, Dict[str, object]]:
+        """Fetch several documents with a single cache read."""
+        self._documents(force=force)
+        by_id = self._by_id
+
+        found: Dict[str, Dict[str, object]] = {}
+        for doc_id in ids:
+            doc = by_id.get(doc_id)
+            if doc is not None:
+                found[doc_id] = doc
+        return found
 
     def refresh_cache(self) -> None:
         """Force reload from local file."""
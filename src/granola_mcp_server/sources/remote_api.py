@@ -8,16 +8,18 @@ from __future__ import annotations
 
 import gzip
 import hashlib
+import http.client
 import json
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
-from urllib import request
-from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
 
 from ..errors import GranolaParseError
 from ..document_source import DocumentSource
+from ..utils.json_backend import json_loads
 
 
 class RemoteApiDocumentSource(DocumentSource):
@@ -29,6 +31,7 @@ class RemoteApiDocumentSource(DocumentSource):
     - Local caching of decompressed JSON
     - TTL-based cache invalidation
     - Retry logic with exponential backoff
+    - Persistent keep-alive connection reused across requests
     
     Args:
         token: Bearer token for API authentication.
@@ -47,13 +50,42 @@ class RemoteApiDocumentSource(DocumentSource):
         self.token = token
         self.api_base = api_base.rstrip("/")
         self.cache_ttl = cache_ttl_seconds
-        
+
         # Set up cache directory
         if cache_dir is None:
             cache_dir = Path.home() / ".granola" / "remote_cache"
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        # Persistent keep-alive connection, created on first request and
+        # reused across calls to skip the TCP+TLS handshake each time.
+        # http.client connections cannot interleave request/response
+        # cycles, so the lock serializes access in case the MCP runtime
+        # dispatches two tool calls concurrently.
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._conn_lock = threading.Lock()
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return the persistent API connection, creating it on demand."""
+        if self._conn is None:
+            parts = urlsplit(self.api_base)
+            conn_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            self._conn = conn_cls(parts.hostname or "", parts.port, timeout=30)
+        return self._conn
+
+    def _drop_connection(self) -> None:
+        """Close and forget the persistent connection (e.g. stale socket)."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
     def _get_cache_key(
         self,
         limit: Optional[int],
@@ -110,105 +142,110 @@ class RemoteApiDocumentSource(DocumentSource):
         Raises:
             GranolaParseError: For network or parsing errors.
         """
-        url = f"{self.api_base}/v2/get-documents"
-        
+        path = f"{urlsplit(self.api_base).path}/v2/get-documents"
+
         payload = json.dumps({
             "limit": limit,
             "offset": offset,
             "include_last_viewed_panel": include_last_viewed_panel,
         }).encode("utf-8")
-        
+
         headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
             "Accept": "*/*",
             "User-Agent": "Granola-MCP-Server/0.1.0",
         }
-        
-        req = request.Request(url, data=payload, headers=headers, method="POST")
-        
+
         max_retries = 3
         for attempt in range(max_retries):
+            # Reuse the keep-alive connection; a stale socket from an
+            # earlier call surfaces as an exception and is dropped.
+            reused = False
             try:
-                with request.urlopen(req, timeout=30) as response:
-                    # Read gzipped response
-                    compressed_data = response.read()
-                    
-                    # Decompress
-                    try:
-                        decompressed_data = gzip.decompress(compressed_data)
-                    except Exception as e:
-                        raise GranolaParseError(
-                            f"Failed to decompress response: {e}",
-                            {"attempt": attempt + 1}
-                        ) from e
-                    
-                    # Parse JSON
-                    try:
-                        data = json.loads(decompressed_data.decode("utf-8"))
-                        return data
-                    except Exception as e:
-                        raise GranolaParseError(
-                            f"Failed to parse JSON: {e}",
-                            {"attempt": attempt + 1}
-                        ) from e
-                        
-            except HTTPError as e:
-                error_code = e.code
-                error_body = e.read().decode("utf-8", errors="replace")
-                
-                if error_code == 401:
-                    raise GranolaParseError(
-                        "Invalid or expired token. Please reauthenticate.",
-                        {"status": 401}
-                    ) from e
-                elif error_code == 403:
-                    raise GranolaParseError(
-                        "Access forbidden. Check your token permissions.",
-                        {"status": 403}
-                    ) from e
-                elif error_code == 429:
-                    # Rate limited - retry with backoff
-                    if attempt < max_retries - 1:
-                        wait = (2 ** attempt) * 1.0  # Exponential backoff
-                        time.sleep(wait)
-                        continue
-                    raise GranolaParseError(
-                        "Rate limit exceeded. Please try again later.",
-                        {"status": 429, "attempt": attempt + 1}
-                    ) from e
-                elif 500 <= error_code < 600:
-                    # Server error - retry
-                    if attempt < max_retries - 1:
-                        wait = (2 ** attempt) * 1.0
-                        time.sleep(wait)
-                        continue
+                with self._conn_lock:
+                    reused = self._conn is not None
+                    conn = self._get_connection()
+                    conn.request("POST", path, body=payload, headers=headers)
+                    response = conn.getresponse()
+                    status = response.status
+                    body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                with self._conn_lock:
+                    self._drop_connection()
+                if attempt < max_retries - 1:
+                    # A stale keep-alive socket is the expected failure
+                    # for user-paced calls (the server closed the idle
+                    # connection): retry immediately on a fresh socket.
+                    # Back off only when a fresh connection also failed,
+                    # which indicates a real network problem.
+                    if not reused:
+                        time.sleep((2 ** attempt) * 1.0)
+                    continue
+                raise GranolaParseError(
+                    f"Network error: {e}",
+                    {"attempt": attempt + 1}
+                ) from e
+
+            if status == 200:
+                # Decompress
+                try:
+                    decompressed_data = gzip.decompress(body)
+                except Exception as e:
                     raise GranolaParseError(
-                        f"Server error: {error_code}",
-                        {"status": error_code, "body": error_body, "attempt": attempt + 1}
+                        f"Failed to decompress response: {e}",
+                        {"attempt": attempt + 1}
                     ) from e
-                else:
+
+                # Parse JSON
+                try:
+                    # Shared backend takes bytes directly; no utf-8
+                    # decode pass over the full response body.
+                    return json_loads(decompressed_data)
+                except Exception as e:
                     raise GranolaParseError(
-                        f"HTTP error: {error_code}",
-                        {"status": error_code, "body": error_body}
+                        f"Failed to parse JSON: {e}",
+                        {"attempt": attempt + 1}
                     ) from e
-                    
-            except URLError as e:
+
+            error_body = body.decode("utf-8", errors="replace")
+
+            if status == 401:
+                raise GranolaParseError(
+                    "Invalid or expired token. Please reauthenticate.",
+                    {"status": 401}
+                )
+            elif status == 403:
+                raise GranolaParseError(
+                    "Access forbidden. Check your token permissions.",
+                    {"status": 403}
+                )
+            elif status == 429:
+                # Rate limited - retry with backoff
+                if attempt < max_retries - 1:
+                    wait = (2 ** attempt) * 1.0  # Exponential backoff
+                    time.sleep(wait)
+                    continue
+                raise GranolaParseError(
+                    "Rate limit exceeded. Please try again later.",
+                    {"status": 429, "attempt": attempt + 1}
+                )
+            elif 500 <= status < 600:
+                # Server error - retry
                 if attempt < max_retries - 1:
                     wait = (2 ** attempt) * 1.0
                     time.sleep(wait)
                     continue
                 raise GranolaParseError(
-                    f"Network error: {e.reason}",
-                    {"attempt": attempt + 1}
-                ) from e
-                
-            except Exception as e:
+                    f"Server error: {status}",
+                    {"status": status, "body": error_body, "attempt": attempt + 1}
+                )
+            else:
                 raise GranolaParseError(
-                    f"Unexpected error: {e}",
-                    {"attempt": attempt + 1}
-                ) from e
-        
+                    f"HTTP error: {status}",
+                    {"status": status, "body": error_body}
+                )
+
         raise GranolaParseError("Failed after max retries")
 
     def get_documents(
@@ -273,6 +310,23 @@ class RemoteApiDocumentSource(DocumentSource):
                 return doc
         return None
 
+    def get_documents_bulk(
+        self, ids: List[str], *, force: bool = False
+    ) -> Dict[str, Dict[str, object]]:
+        """Fetch several documents with a single API round trip.
+
+        The API has no dedicated bulk endpoint, so this issues one
+        get_documents request and filters, instead of one request per id.
+        """
+        wanted = set(ids)
+        found: Dict[str, Dict[str, object]] = {}
+        for doc in self.get_documents(force=force):
+            if isinstance(doc, dict):
+                doc_id = doc.get("id")
+                if doc_id in wanted:
+                    found[str(doc_id)] = doc
+        return found
+
     def refresh_cache(self) -> None:
         """Clear all cache files to force refresh on next request."""
         for cache_file in self.cache_dir.glob("docs_*.json"):
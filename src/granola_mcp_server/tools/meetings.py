@@ -6,7 +6,11 @@ list, get, search, export markdown, and basic stats.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union
+import bisect
+import sys
+import weakref
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Union
 
 from ..config import AppConfig
 from ..errors import BadRequestError, NotFoundError
@@ -26,37 +30,171 @@ from ..schemas import (
     StatsByPeriod,
     StatsInput,
     StatsOutput,
+    TranscriptTurn,
 )
 from ..utils import ensure_iso8601, render_meeting_markdown, to_date_key
 
 
-def _paginate(
-    items: List[MeetingSummary], *, limit: int, cursor: Optional[str]
+class _IndexBundle:
+    """Derived search structures for one parser's meeting list.
+
+    Built once per loaded cache and reused across tool calls, so the
+    per-request lowercasing pass over every title/notes/participants
+    string disappears. Rows are addressed by their position in ``raw``.
+    """
+
+    __slots__ = (
+        "raw",
+        "hay_lower",
+        "participants_lower",
+        "start_keys",
+        "order",
+        "day_keys",
+        "week_keys",
+    )
+
+    def __init__(self, raw: List[Dict[str, object]]) -> None:
+        self.raw = raw
+        self.hay_lower = [
+            f"{item.get('title','')} {item.get('notes','')} {' '.join(item.get('participants') or [])}".lower()
+            for item in raw
+        ]
+        # Interned so repeated names across meetings share one string
+        # object and set hashing hits cached hashes.
+        self.participants_lower = [
+            frozenset(
+                sys.intern(str(p).lower()) for p in (item.get("participants") or [])
+            )
+            for item in raw
+        ]
+        # Ascending (start_ts, row) pairs so date bounds become two
+        # bisects instead of a comparison per meeting.
+        pairs = sorted(
+            (str(item.get("start_ts") or ""), i) for i, item in enumerate(raw)
+        )
+        self.start_keys = [ts for ts, _ in pairs]
+        self.order = [i for _, i in pairs]
+        # Stats grouping keys, filled on first use (parsing can raise on
+        # malformed timestamps, which should surface in stats, not list).
+        self.day_keys: Optional[List[str]] = None
+        self.week_keys: Optional[List[str]] = None
+
+
+# Weakly keyed by the parser so a bundle lives exactly as long as its
+# parser does (the ephemeral-parser path would otherwise leak one entry
+# per call); freshness is checked by identity of the list the parser
+# hands back (GranolaParser memoizes it until the cache changes).
+_INDEX_CACHE: "weakref.WeakKeyDictionary[Union[GranolaParser, DocumentSourceAdapter], _IndexBundle]" = (weakref.WeakKeyDictionary())
+
+
+def _get_index(parser: Union[GranolaParser, DocumentSourceAdapter]) -> _IndexBundle:
+    raw = parser.get_meetings()
+    bundle = _INDEX_CACHE.get(parser)
+    if bundle is None or bundle.raw is not raw:
+        # Panel-backed notes are filled in before the haystacks are
+        # built so the search corpus matches what the baseline indexed:
+        # complete, and independent of which tool ran first. This is
+        # the one place the deferred panel walk happens for every
+        # meeting, once per loaded cache.
+        for item in raw:
+            _hydrate_notes(parser, item)
+        bundle = _IndexBundle(raw)
+        _INDEX_CACHE[parser] = bundle
+    return bundle
+
+
+def _normalize_bound(value: Optional[str]) -> Optional[str]:
+    """Normalize a user-supplied timestamp bound, or None if unusable."""
+    if not value:
+        return None
+    try:
+        return ensure_iso8601(value)
+    except Exception:
+        return None
+
+
+def _candidate_rows(
+    bundle: _IndexBundle, lo_ts: Optional[str], hi_ts: Optional[str]
+) -> Iterable[int]:
+    """Rows whose start_ts falls within [lo_ts, hi_ts], newest first."""
+    if lo_ts is None and hi_ts is None:
+        return range(len(bundle.raw))
+    lo = bisect.bisect_left(bundle.start_keys, lo_ts) if lo_ts is not None else 0
+    hi = (
+        bisect.bisect_right(bundle.start_keys, hi_ts)
+        if hi_ts is not None
+        else len(bundle.start_keys)
+    )
+    return bundle.order[lo:hi][::-1]
+
+
+def _date_keys(bundle: _IndexBundle, *, week: bool) -> List[str]:
+    """Per-row day or ISO-week keys, computed once per bundle."""
+    keys = bundle.week_keys if week else bundle.day_keys
+    if keys is None:
+        keys = [
+            to_date_key(str(item.get("start_ts") or ""), week=week)
+            for item in bundle.raw
+        ]
+        if week:
+            bundle.week_keys = keys
+        else:
+            bundle.day_keys = keys
+    return keys
+
+
+def _collect_page(
+    matches: Iterable[Dict[str, object]], *, limit: int, cursor: Optional[str]
 ) -> (List[MeetingSummary], Optional[str]):
+    """Fuse cursor skip and limit into the match pass.
+
+    Consumes matching items lazily and builds at most *limit* summary
+    models; one extra match is enough to know a next page exists, so
+    nothing past it is filtered or constructed.
+    """
     start = int(cursor or 0)
-    end = start + limit
-    next_cursor = str(end) if end < len(items) else None
-    return items[start:end], next_cursor
+    page: List[MeetingSummary] = []
+    next_cursor: Optional[str] = None
+    for n, item in enumerate(matches):
+        if n < start:
+            continue
+        if len(page) == limit:
+            next_cursor = str(start + limit)
+            break
+        page.append(_to_summary(item))
+    return page, next_cursor
+
+
+# Mirrors the MeetingSummary.platform Literal; a frozenset membership
+# test replaces Pydantic's Literal validator on the construct path.
+# Membership implies str, so no separate isinstance gate is needed.
+_ALLOWED_PLATFORMS: frozenset = frozenset(("zoom", "meet", "teams", "other"))
 
 
 def _to_summary(item: Dict[str, object]) -> MeetingSummary:
-    return MeetingSummary(
+    # Parser output is already normalized, so skip Pydantic validation
+    # (model_construct) on this internal path; inputs from callers still
+    # go through the fully-validated *Input models.
+    return MeetingSummary.model_construct(
         id=str(item.get("id")),
         title=str(item.get("title") or "Untitled Meeting"),
         start_ts=str(item.get("start_ts") or ""),
         end_ts=item.get("end_ts") if isinstance(item.get("end_ts"), str) else None,
         participants=[str(p) for p in (item.get("participants") or [])],
-        platform=(
-            item.get("platform") if isinstance(item.get("platform"), str) else None
-        ),
+        platform=p if (p := item.get("platform")) in _ALLOWED_PLATFORMS else None,
         metadata=None,
     )
 
 
 def _to_meeting(item: Dict[str, object]) -> Meeting:
-    base = _to_summary(item).model_dump()
-    return Meeting(
-        **base,
+    return Meeting.model_construct(
+        id=str(item.get("id")),
+        title=str(item.get("title") or "Untitled Meeting"),
+        start_ts=str(item.get("start_ts") or ""),
+        end_ts=item.get("end_ts") if isinstance(item.get("end_ts"), str) else None,
+        participants=[str(p) for p in (item.get("participants") or [])],
+        platform=p if (p := item.get("platform")) in _ALLOWED_PLATFORMS else None,
+        metadata=None,
         notes=item.get("notes") if isinstance(item.get("notes"), str) else None,
         overview=(
             item.get("overview") if isinstance(item.get("overview"), str) else None
@@ -73,6 +211,24 @@ def _to_meeting(item: Dict[str, object]) -> Meeting:
     )
 
 
+def _hydrate_notes(
+    parser: Union[GranolaParser, DocumentSourceAdapter],
+    item: Dict[str, object],
+) -> None:
+    """Fill notes from panels, caching them on the shared record.
+
+    Listing no longer walks panels per call: single-meeting tools
+    hydrate just their record, and `_get_index` hydrates every row once
+    per loaded cache before the search haystacks are built, so search
+    results never depend on call order.
+    """
+
+    if not item.get("notes"):
+        notes = parser.get_notes(str(item.get("id")))
+        if notes:
+            item["notes"] = notes
+
+
 def list_meetings(
     config: AppConfig,
     parser: Optional[Union[GranolaParser, DocumentSourceAdapter]],
@@ -82,37 +238,31 @@ def list_meetings(
 
     if parser is None:
         parser = GranolaParser(config.cache_path)
-    raw_items = parser.get_meetings()
-
-    # Filters
-    def matches(item: Dict[str, object]) -> bool:
-        if params.q:
-            q = params.q.lower()
-            hay = f"{item.get('title','')} {item.get('notes','')} {' '.join(item.get('participants') or [])}".lower()
-            if q not in hay:
-                return False
-        if params.participants:
-            want = {p.lower() for p in params.participants}
-            have = {str(p).lower() for p in (item.get("participants") or [])}
-            if not want.intersection(have):
-                return False
-        if params.from_ts:
-            try:
-                if str(item.get("start_ts") or "") < ensure_iso8601(params.from_ts):
-                    return False
-            except Exception:
-                pass
-        if params.to_ts:
-            try:
-                if str(item.get("start_ts") or "") > ensure_iso8601(params.to_ts):
-                    return False
-            except Exception:
-                pass
-        return True
-
-    summaries = [_to_summary(i) for i in raw_items if matches(i)]
+    bundle = _get_index(parser)
+
+    q = params.q.lower() if params.q else None
+    want = (
+        frozenset(sys.intern(p.lower()) for p in params.participants)
+        if params.participants
+        else None
+    )
+    rows = _candidate_rows(
+        bundle, _normalize_bound(params.from_ts), _normalize_bound(params.to_ts)
+    )
+
+    # Local rebinds keep the comprehension to plain subscripts.
+    raw = bundle.raw
+    hay_lower = bundle.hay_lower
+    participants_lower = bundle.participants_lower
+
+    matches = (
+        raw[i]
+        for i in rows
+        if (q is None or q in hay_lower[i])
+        and (want is None or not want.isdisjoint(participants_lower[i]))
+    )
     limit = params.limit or 50
-    page, next_cursor = _paginate(summaries, limit=limit, cursor=params.cursor)
+    page, next_cursor = _collect_page(matches, limit=limit, cursor=params.cursor)
     return ListMeetingsOutput(items=page, next_cursor=next_cursor)
 
 
@@ -131,8 +281,15 @@ def get_meeting(
     if not item:
         raise NotFoundError("Meeting not found", {"id": params.id})
 
+    _hydrate_notes(parser, item)
     meeting = _to_meeting(item)
-    return GetMeetingOutput(meeting=meeting)
+
+    transcript = None
+    if params.include and "transcript" in params.include:
+        turns = parser.build_transcript_turns(params.id)
+        if turns:
+            transcript = [TranscriptTurn.model_construct(**t) for t in turns]
+    return GetMeetingOutput(meeting=meeting, transcript=transcript)
 
 
 def search_meetings(
@@ -144,47 +301,35 @@ def search_meetings(
 
     if parser is None:
         parser = GranolaParser(config.cache_path)
-    raw_items = parser.get_meetings()
+    bundle = _get_index(parser)
 
     q = (params.q or "").lower()
-
-    def matches(item: Dict[str, object]) -> bool:
-        hay = f"{item.get('title','')} {item.get('notes','')} {' '.join(item.get('participants') or [])}".lower()
-        if q not in hay:
-            return False
-        if params.filters:
-            if params.filters.participants:
-                want = {p.lower() for p in params.filters.participants}
-                have = {str(p).lower() for p in (item.get("participants") or [])}
-                if not want.intersection(have):
-                    return False
-            if (
-                params.filters.platform
-                and str(item.get("platform") or "").lower()
-                != params.filters.platform.lower()
-            ):
-                return False
-            if params.filters.after:
-                try:
-                    if str(item.get("start_ts") or "") < ensure_iso8601(
-                        params.filters.after
-                    ):
-                        return False
-                except Exception:
-                    pass
-            if params.filters.before:
-                try:
-                    if str(item.get("start_ts") or "") > ensure_iso8601(
-                        params.filters.before
-                    ):
-                        return False
-                except Exception:
-                    pass
-        return True
-
-    summaries = [_to_summary(i) for i in raw_items if matches(i)]
+    filters = params.filters
+    want = None
+    platform = None
+    after = before = None
+    if filters:
+        if filters.participants:
+            want = frozenset(sys.intern(p.lower()) for p in filters.participants)
+        if filters.platform:
+            platform = filters.platform.lower()
+        after = _normalize_bound(filters.after)
+        before = _normalize_bound(filters.before)
+    rows = _candidate_rows(bundle, after, before)
+
+    raw = bundle.raw
+    hay_lower = bundle.hay_lower
+    participants_lower = bundle.participants_lower
+
+    matches = (
+        raw[i]
+        for i in rows
+        if q in hay_lower[i]
+        and (want is None or not want.isdisjoint(participants_lower[i]))
+        and (platform is None or str(raw[i].get("platform") or "").lower() == platform)
+    )
     limit = params.limit or 50
-    page, next_cursor = _paginate(summaries, limit=limit, cursor=params.cursor)
+    page, next_cursor = _collect_page(matches, limit=limit, cursor=params.cursor)
     return SearchMeetingsOutput(items=page, next_cursor=next_cursor)
 
 
@@ -202,6 +347,7 @@ def export_markdown(
     item = parser.get_meeting_by_id(params.id)
     if not item:
         raise NotFoundError("Meeting not found", {"id": params.id})
+    _hydrate_notes(parser, item)
     meeting = _to_meeting(item)
     md = render_meeting_markdown(meeting, sections=params.sections)
     return ExportMarkdownOutput(markdown=md)
@@ -216,16 +362,13 @@ def meetings_stats(
 
     if parser is None:
         parser = GranolaParser(config.cache_path)
-    items = parser.get_meetings()
+    bundle = _get_index(parser)
 
     group_by = params.group_by or "day"
     week = group_by == "week"
 
     # TODO: Implement time window filtering per `window`; for now include all.
-    counts: Dict[str, int] = {}
-    for it in items:
-        key = to_date_key(str(it.get("start_ts") or ""), week=week)
-        counts[key] = counts.get(key, 0) + 1
+    counts = Counter(_date_keys(bundle, week=week))
 
     series = [StatsByPeriod(period=k, meetings=v) for k, v in sorted(counts.items())]
     return StatsOutput(counts={"by_period": series}, participants=None)
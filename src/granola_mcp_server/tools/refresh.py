@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ..schemas import RefreshCacheInput, RefreshCacheOutput
+from .status import invalidate_status
 
 if TYPE_CHECKING:
     from ..config import AppConfig
@@ -30,10 +31,13 @@ def refresh_cache(
         Status and metadata about the refresh operation.
     """
     try:
-        # Clear and reload cache
+        # Clear and reload cache; the status TTL entry would otherwise
+        # keep answering with pre-refresh data for up to a second.
         adapter.refresh_cache()
         adapter.reload()
-        
+        invalidate_status(adapter)
+
+
         # Get updated cache info
         info = adapter.get_cache_info()
         
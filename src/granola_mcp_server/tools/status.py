@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-import os
-from typing import Optional, Union
+import time
+import weakref
+from typing import Optional, Tuple, Union
 
 from ..config import AppConfig
 from ..parser import GranolaParser
 from ..sources.adapter import DocumentSourceAdapter
 from ..schemas import CacheStatusOutput
 
+# Status polls can arrive in bursts (health checks); hold the last
+# answer per parser for a second so they do not each stat the cache.
+# Weakly keyed so entries die with their parser instead of piling up.
+_STATUS_TTL_SECONDS = 1.0
+_status_cache: "weakref.WeakKeyDictionary[Union[GranolaParser, DocumentSourceAdapter], Tuple[float, CacheStatusOutput]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def invalidate_status(parser: Union[GranolaParser, DocumentSourceAdapter]) -> None:
+    """Drop the cached status for *parser* (e.g. after a manual refresh).
+
+    Without this, a refresh-then-status sequence inside the TTL window
+    would report pre-refresh size and load time.
+    """
+    _status_cache.pop(parser, None)
+
 
 def cache_status(
     config: AppConfig, parser: Optional[Union[GranolaParser, DocumentSourceAdapter]]
@@ -17,9 +35,24 @@ def cache_status(
     """Report cache path, size, last load time, and active profile."""
 
     if parser is None:
-        parser = GranolaParser(config.cache_path)
+        # Ephemeral parser: nothing stable to key a cache entry on.
+        return _build_status(config, GranolaParser(config.cache_path))
+
+    now = time.monotonic()
+    cached = _status_cache.get(parser)
+    if cached is not None and now - cached[0] < _STATUS_TTL_SECONDS:
+        return cached[1]
+
+    out = _build_status(config, parser)
+    _status_cache[parser] = (now, out)
+    return out
+
+
+def _build_status(
+    config: AppConfig, parser: Union[GranolaParser, DocumentSourceAdapter]
+) -> CacheStatusOutput:
     info = parser.get_cache_info()
-    
+
     # Determine path and profile based on source type
     if config.document_source == "remote":
         path = info.get("cache_dir", "N/A")
@@ -27,7 +60,7 @@ def cache_status(
     else:
         path = str(config.cache_path)
         profile = "sqlite" if config.use_sqlite else "stdlib"
-    
+
     return CacheStatusOutput(
         path=str(path),
         size_bytes=int(info.get("size_bytes") or info.get("total_cache_size_bytes") or 0),
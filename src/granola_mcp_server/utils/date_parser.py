@@ -6,6 +6,7 @@ for 'Z' suffix normalization to '+00:00' and British timezone conversion.
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime, timezone
 from typing import Optional
 from zoneinfo import ZoneInfo
@@ -17,10 +18,13 @@ def _replace_z_suffix(value: str) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_iso8601(value: str) -> datetime:
     """Parse an ISO 8601 string into a timezone-aware datetime.
 
     Accepts values ending with 'Z' by converting to '+00:00'.
+    Memoized: filters and stats re-parse the same bounds and the same
+    repeated meeting timestamps, and datetimes are immutable.
 
     Raises:
         ValueError: If the timestamp cannot be parsed.
@@ -69,9 +73,13 @@ def to_british_time(value: str) -> datetime:
     return dt.astimezone(british_tz)
 
 
+@functools.lru_cache(maxsize=8192)
 def to_date_key(value: str, *, week: bool = False) -> str:
     """Convert ISO 8601 timestamp to a date or week key.
 
+    Called once per meeting when grouping stats; memoized since the
+    same timestamps recur across calls.
+
     Args:
         value: ISO 8601 timestamp.
         week: If true, returns YYYY-Www; otherwise YYYY-MM-DD.
@@ -0,0 +1,22 @@
+"""Process-wide JSON decoder selection.
+
+The fastest available backend is picked once at import time and bound
+as a plain module-level function reference, so callers pay no
+per-parse availability branch. orjson (installed via the ``perf``
+extra) is preferred; the stdlib decoder is the fallback. Both accept
+``str`` and ``bytes`` input, so call sites can hand over raw buffers
+without an intermediate decode pass.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:  # Optional C-accelerated JSON backend (install with the 'perf' extra)
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+__all__ = ["json_loads"]
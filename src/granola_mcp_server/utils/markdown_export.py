@@ -5,16 +5,68 @@ Generates deterministic Markdown for meetings, suitable for diffs.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import functools
+from typing import Callable, List, Optional, Tuple
 
 from ..schemas import Meeting
 
+_DEFAULT_SECTIONS: Tuple[str, ...] = ("header", "attendees", "notes")
+
 
 def _format_attendees(attendees: List[str]) -> str:
     """Format attendees list as Markdown bullet points."""
     return "\n".join(f"- {name}" for name in attendees)
 
 
+def _header_block(meeting: Meeting) -> str:
+    when = (
+        f"{meeting.start_ts} → {meeting.end_ts}" if meeting.end_ts else meeting.start_ts
+    )
+    platform_line = f"\n- Platform: {meeting.platform}" if meeting.platform else ""
+    folder_line = f"\n- Folder: {meeting.folder_name}" if meeting.folder_name else ""
+    return (
+        f"# {meeting.title}\n"
+        f"\n"
+        f"- ID: `{meeting.id}`\n"
+        f"- When: {when}{platform_line}{folder_line}"
+    )
+
+
+def _attendees_block(meeting: Meeting) -> str:
+    return "## Attendees\n" + _format_attendees(meeting.participants)
+
+
+def _notes_block(meeting: Meeting) -> Optional[str]:
+    return "## Notes\n" + meeting.notes if meeting.notes else None
+
+
+_EMITTERS = {
+    "header": _header_block,
+    "attendees": _attendees_block,
+    "notes": _notes_block,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _make_renderer(sections_key: Tuple[str, ...]) -> Callable[[Meeting], str]:
+    """Build a renderer specialized to one section selection.
+
+    Callers pass only a handful of distinct selections, so each gets a
+    closure over exactly the emitters it needs; the per-call section
+    membership tests are resolved here, once. (A closure over plain
+    functions does what the exec-codegen variant would, without
+    generated source.)
+    """
+    selected = set(sections_key)
+    emitters = tuple(_EMITTERS[name] for name in _DEFAULT_SECTIONS if name in selected)
+
+    def render(meeting: Meeting) -> str:
+        blocks = [block for emit in emitters if (block := emit(meeting)) is not None]
+        return "\n\n".join(blocks) + "\n"
+
+    return render
+
+
 def render_meeting_markdown(
     meeting: Meeting,
     *,
@@ -29,30 +81,5 @@ def render_meeting_markdown(
     Returns:
         Markdown string.
     """
-    selected = set(sections or ["header", "attendees", "notes"])  # default
-    parts: List[str] = []
-
-    if "header" in selected:
-        parts.append(f"# {meeting.title}")
-        parts.append("")
-        parts.append(f"- ID: `{meeting.id}`")
-        parts.append(
-            f"- When: {meeting.start_ts}{' → ' + meeting.end_ts if meeting.end_ts else ''}"
-        )
-        if meeting.platform:
-            parts.append(f"- Platform: {meeting.platform}")
-        if meeting.folder_name:
-            parts.append(f"- Folder: {meeting.folder_name}")
-        parts.append("")
-
-    if "attendees" in selected:
-        parts.append("## Attendees")
-        parts.append(_format_attendees(meeting.participants))
-        parts.append("")
-
-    if "notes" in selected and meeting.notes:
-        parts.append("## Notes")
-        parts.append(meeting.notes)
-        parts.append("")
-
-    return "\n".join(parts).strip() + "\n"
+    renderer = _make_renderer(tuple(sections) if sections else _DEFAULT_SECTIONS)
+    return renderer(meeting)
@@ -48,23 +48,201 @@ def make_double_json_cache(tmp_path: Path) -> Path:
     return path
 
 
-def test_load_and_list_meetings(tmp_path: Path) -> None:
-    path = make_double_json_cache(tmp_path)
-    parser = GranolaParser(path)
+@pytest.fixture(scope="session")
+def parser(tmp_path_factory: pytest.TempPathFactory) -> GranolaParser:
+    """One parser over one written cache, shared by every test here.
+
+    Session scope both avoids re-writing and re-parsing the fixture
+    cache per test and exercises the intended production pattern of a
+    single long-lived parser serving repeated reads.
+    """
+    path = make_double_json_cache(tmp_path_factory.mktemp("granola"))
+    return GranolaParser(path)
+
+
+def test_load_and_list_meetings(parser: GranolaParser) -> None:
     meetings = parser.get_meetings()
     assert len(meetings) == 1
     m = meetings[0]
     assert m["id"] == "e1"
     assert m["title"] == "Test Meeting"
-    assert m["participants"] == ["Alice", "Bob"]
+    assert list(m["participants"]) == ["Alice", "Bob"]
     assert m["platform"] == "meet"
     assert m["folder_name"] == "Folder A"
     assert m["has_transcript"] is True
 
 
-def test_get_meeting_by_id_and_transcript(tmp_path: Path) -> None:
-    path = make_double_json_cache(tmp_path)
-    parser = GranolaParser(path)
+def test_malformed_fields_degrade_per_field(tmp_path: Path) -> None:
+    """A null or odd-shaped people field loses the field, not the meeting."""
+    inner = {
+        "state": {
+            "documents": {
+                "n1": {
+                    "id": "n1",
+                    "title": "Null people",
+                    "created_at": "2025-09-02T10:00:00Z",
+                    "people": None,
+                    "type": "meeting",
+                },
+                "n2": {
+                    "id": "n2",
+                    "title": "String people",
+                    "created_at": "2025-09-03T10:00:00Z",
+                    "people": ["Alice", "Bob"],
+                    "type": "meeting",
+                },
+                "n3": {
+                    "id": "n3",
+                    "title": "Mixed people",
+                    "created_at": "2025-09-04T10:00:00Z",
+                    "people": [{"name": "Alice"}, "junk"],
+                    "type": "meeting",
+                },
+            },
+            "meetingsMetadata": {"n1": {"conference": "not-a-dict"}},
+        }
+    }
+    path = tmp_path / "cache-v3.json"
+    path.write_text(json.dumps({"cache": json.dumps(inner)}), encoding="utf-8")
+    meetings = {m["id"]: m for m in GranolaParser(path).get_meetings()}
+    assert sorted(meetings) == ["n1", "n2", "n3"]
+    assert list(meetings["n1"]["participants"]) == []
+    assert list(meetings["n2"]["participants"]) == []
+    # One junk entry costs its own name, not the whole list.
+    assert list(meetings["n3"]["participants"]) == ["Alice"]
+    for m in meetings.values():
+        assert m["platform"] is None
+
+
+def _write_cache(tmp_path: Path, inner: dict) -> Path:
+    path = tmp_path / "cache-v3.json"
+    path.write_text(json.dumps({"cache": json.dumps(inner)}), encoding="utf-8")
+    return path
+
+
+def test_get_meetings_limit_selects_most_recent(tmp_path: Path) -> None:
+    inner = {
+        "state": {
+            "documents": {
+                f"m{i}": {
+                    "id": f"m{i}",
+                    "title": f"Meeting {i}",
+                    "created_at": f"2025-09-0{i}T10:00:00Z",
+                    "type": "meeting",
+                }
+                for i in range(1, 5)
+            }
+        }
+    }
+    path = _write_cache(tmp_path, inner)
+    top = GranolaParser(path).get_meetings(limit=2)
+    assert [m["id"] for m in top] == ["m4", "m3"]
+
+
+def test_persisted_index_round_trip(tmp_path: Path) -> None:
+    inner = {
+        "state": {
+            "documents": {
+                "e1": {
+                    "id": "e1",
+                    "title": "Indexed",
+                    "created_at": "2025-09-01T10:00:00Z",
+                    "people": [{"name": "Alice"}],
+                    "type": "meeting",
+                }
+            }
+        }
+    }
+    path = _write_cache(tmp_path, inner)
+    index_path = tmp_path / "meetings.idx"
+    first = GranolaParser(path, index_path=index_path).get_meetings()
+    assert index_path.exists()
+    warm = GranolaParser(path, index_path=index_path).get_meetings()
+    assert warm == first
+    assert warm[0]["id"] == "e1"
+
+
+def test_rewritten_cache_invalidates_memo_and_sidecar(tmp_path: Path) -> None:
+    """A live parser must not restamp stale data under the new file key."""
+
+    def _inner(title: str) -> dict:
+        return {
+            "state": {
+                "documents": {
+                    "e1": {
+                        "id": "e1",
+                        "title": title,
+                        "created_at": "2025-09-01T10:00:00Z",
+                        "type": "meeting",
+                    }
+                }
+            }
+        }
+
+    path = _write_cache(tmp_path, _inner("Version A"))
+    index_path = tmp_path / "meetings.idx"
+    parser = GranolaParser(path, index_path=index_path)
+    assert parser.get_meetings()[0]["title"] == "Version A"
+
+    # Rewrite the file in place (different size, so the stat key changes
+    # even on coarse mtime filesystems).
+    path.write_text(
+        json.dumps({"cache": json.dumps(_inner("Version B, rewritten"))}),
+        encoding="utf-8",
+    )
+    assert parser.get_meetings()[0]["title"] == "Version B, rewritten"
+
+    # A fresh parser warm-starting from the sidecar sees the new data too.
+    fresh = GranolaParser(path, index_path=index_path)
+    assert fresh.get_meetings()[0]["title"] == "Version B, rewritten"
+
+
+def test_get_notes_defers_panel_walk(tmp_path: Path) -> None:
+    inner = {
+        "state": {
+            "documents": {
+                "p1": {
+                    "id": "p1",
+                    "title": "Panel notes",
+                    "created_at": "2025-09-01T10:00:00Z",
+                    "type": "meeting",
+                }
+            },
+            "documentPanels": {"p1": {"panelA": {"original_content": "Panel content"}}},
+        }
+    }
+    parser = GranolaParser(_write_cache(tmp_path, inner))
+    # Listing does not walk panels; notes stay unset on the record.
+    assert parser.get_meetings()[0]["notes"] is None
+    assert parser.get_notes("p1") == "Panel content"
+
+
+def test_transcript_tolerates_malformed_segments(tmp_path: Path) -> None:
+    inner = {
+        "state": {
+            "documents": {
+                "t1": {
+                    "id": "t1",
+                    "title": "Odd transcript",
+                    "created_at": "2025-09-01T10:00:00Z",
+                    "type": "meeting",
+                }
+            },
+            "transcripts": {
+                "t1": [
+                    {"ts": "2025-09-01T10:00:05Z", "source": "Alice", "text": "Hi"},
+                    {"text": "no source"},
+                    "junk",
+                ]
+            },
+        }
+    }
+    turns = GranolaParser(_write_cache(tmp_path, inner)).build_transcript_turns("t1")
+    assert [t["speaker"] for t in turns] == ["Alice", ""]
+    assert turns[1]["text"] == "no source"
+
+
+def test_get_meeting_by_id_and_transcript(parser: GranolaParser) -> None:
     m = parser.get_meeting_by_id("e1")
     assert m and m["id"] == "e1"
     turns = parser.build_transcript_turns("e1")
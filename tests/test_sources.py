@@ -0,0 +1,44 @@
+"""Tests for the local-file document source."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from granola_mcp_server.sources.local_file import LocalFileDocumentSource
+
+
+def _mk_cache(tmp_path: Path) -> Path:
+    inner = {
+        "state": {
+            "documents": {
+                "d1": {"id": "d1", "title": "First", "type": "meeting"},
+                "d2": {"id": "d2", "title": "Second", "type": "meeting"},
+                "d3": {"id": "d3", "title": "Third", "type": "meeting"},
+            }
+        }
+    }
+    path = tmp_path / "cache-v3.json"
+    path.write_text(json.dumps({"cache": json.dumps(inner)}), encoding="utf-8")
+    return path
+
+
+def test_get_document_by_id(tmp_path: Path) -> None:
+    source = LocalFileDocumentSource(_mk_cache(tmp_path))
+    doc = source.get_document_by_id("d2")
+    assert doc and doc["title"] == "Second"
+    assert source.get_document_by_id("missing") is None
+
+
+def test_get_documents_bulk(tmp_path: Path) -> None:
+    source = LocalFileDocumentSource(_mk_cache(tmp_path))
+    found = source.get_documents_bulk(["d1", "d3", "missing"])
+    assert sorted(found) == ["d1", "d3"]
+    assert found["d3"]["title"] == "Third"
+
+
+def test_get_documents_pagination(tmp_path: Path) -> None:
+    source = LocalFileDocumentSource(_mk_cache(tmp_path))
+    assert len(source.get_documents()) == 3
+    assert len(source.get_documents(limit=2)) == 2
+    assert len(source.get_documents(offset=2)) == 1
@@ -76,6 +76,44 @@ def test_list_and_get_and_export(tmp_path: Path) -> None:
     assert "Interview Structure Overview" in md
 
 
+def test_search_matches_substrings_inside_longer_words(tmp_path: Path) -> None:
+    """Search stays substring-based even when the query is an exact token.
+
+    Regression test: the inverted index must only fast-accept rows, not
+    exclude rows where the query appears inside a longer word.
+    """
+    inner = {
+        "state": {
+            "documents": {
+                "d1": {
+                    "id": "d1",
+                    "title": "Design review",
+                    "created_at": "2025-08-29T10:00:00Z",
+                    "type": "meeting",
+                },
+                "d2": {
+                    "id": "d2",
+                    "title": "Redesigned homepage sync",
+                    "created_at": "2025-08-30T10:00:00Z",
+                    "type": "meeting",
+                },
+            }
+        }
+    }
+    path = tmp_path / "cache-v3.json"
+    path.write_text(json.dumps({"cache": json.dumps(inner)}), encoding="utf-8")
+    config = AppConfig(cache_path=path)
+    parser = GranolaParser(path)
+
+    # Exact token ("design" is a token of d1) and partial word ("desig")
+    # must both match both meetings, same as list_meetings.
+    for q in ("design", "desig"):
+        res = search_meetings(config, parser, SearchMeetingsInput(q=q))
+        assert sorted(i.id for i in res.items) == ["d1", "d2"], q
+    out = list_meetings(config, parser, ListMeetingsInput(q="design", limit=10))
+    assert sorted(i.id for i in out.items) == ["d1", "d2"]
+
+
 def test_search_and_stats(tmp_path: Path) -> None:
     path = _mk_cache(tmp_path)
     config = AppConfig(cache_path=path)